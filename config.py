@@ -2,7 +2,8 @@
 Configuration settings for the MCP GitHub Issue Matcher.
 """
 import os
-from typing import List, Dict
+from types import MappingProxyType
+from typing import List, Dict, Tuple
 
 class Config:
     """Configuration class for the application."""
@@ -11,6 +12,17 @@ class Config:
     GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
     GITHUB_API_BASE_URL = "https://api.github.com"
     
+    # HTTP client settings (one pooled client is shared per process)
+    HTTP_TIMEOUT = 10.0
+    MAX_KEEPALIVE_CONNECTIONS = 20
+    MAX_CONNECTIONS = 100
+    MAX_CONCURRENT_REQUESTS = 16  # Per fan-out, to stay clear of GitHub's secondary rate limits
+    
+    # GitHub response caching
+    GITHUB_CACHE_DIR = os.getenv("GITHUB_CACHE_DIR")  # Persist cached responses here (requires diskcache)
+    GITHUB_CACHE_MAX_ENTRIES = 4096  # In-memory cache size when no directory is set
+    REPO_METADATA_CACHE_TTL = 86400  # Repository languages and topics rarely change
+    
     # Server settings
     HOST = "0.0.0.0"
     PORT = 8000
@@ -24,8 +36,14 @@ class Config:
     DEFAULT_MAX_RESULTS = 20
     MAX_REPOS_PER_LANGUAGE = 5
     MAX_ISSUES_PER_REPO = 10
+    SEARCH_CACHE_TTL = 600  # Seconds to reuse raw issue search results
+    SEARCH_CACHE_MAX_ENTRIES = 1024
+    GRAPHQL_SEARCHES_PER_QUERY = 5  # Searches batched into each concurrently sent GraphQL query
     
     # Skill extraction settings
+    USER_SKILLS_CACHE_TTL = 600  # Seconds to reuse a user's analyzed skills
+    USER_SKILLS_CACHE_MAX_ENTRIES = 10000
+    USER_SKILLS_CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=600"  # Sent by /analyze-user
     MIN_REPO_STARS = 0  # Minimum stars for repositories to consider
     MAX_REPOS_TO_ANALYZE = 50  # Maximum repositories to analyze per user
     
@@ -40,6 +58,7 @@ class Config:
         "question",
         "beginner-friendly"
     ]
+    _SUPPORTED_ISSUE_TYPES_SET = frozenset(SUPPORTED_ISSUE_TYPES)
     
     DIFFICULTY_LEVELS = [
         "beginner",
@@ -47,6 +66,7 @@ class Config:
         "advanced",
         "expert"
     ]
+    _DIFFICULTY_SET = frozenset(DIFFICULTY_LEVELS)
     
     # Experience level thresholds
     EXPERIENCE_THRESHOLDS = {
@@ -73,8 +93,8 @@ class Config:
     }
     
     # Popular repositories by language (for issue searching)
-    POPULAR_REPOSITORIES = {
-        "python": [
+    POPULAR_REPOSITORIES = MappingProxyType({
+        "python": (
             "python/cpython",
             "pallets/flask", 
             "django/django",
@@ -85,8 +105,8 @@ class Config:
             "scikit-learn/scikit-learn",
             "pandas-dev/pandas",
             "numpy/numpy"
-        ],
-        "javascript": [
+        ),
+        "javascript": (
             "microsoft/vscode",
             "facebook/react",
             "vuejs/vue",
@@ -97,8 +117,8 @@ class Config:
             "babel/babel",
             "prettier/prettier",
             "eslint/eslint"
-        ],
-        "typescript": [
+        ),
+        "typescript": (
             "microsoft/TypeScript",
             "nestjs/nest",
             "typeorm/typeorm",
@@ -107,8 +127,8 @@ class Config:
             "grafana/grafana",
             "apollographql/apollo-server",
             "typestack/class-validator"
-        ],
-        "java": [
+        ),
+        "java": (
             "spring-projects/spring-boot",
             "elastic/elasticsearch", 
             "apache/kafka",
@@ -117,8 +137,8 @@ class Config:
             "ReactiveX/RxJava",
             "junit-team/junit5",
             "mockito/mockito"
-        ],
-        "go": [
+        ),
+        "go": (
             "kubernetes/kubernetes",
             "golang/go",
             "docker/docker",
@@ -127,8 +147,8 @@ class Config:
             "hashicorp/terraform",
             "gin-gonic/gin",
             "gorilla/mux"
-        ],
-        "rust": [
+        ),
+        "rust": (
             "rust-lang/rust",
             "actix/actix-web",
             "tokio-rs/tokio",
@@ -137,8 +157,8 @@ class Config:
             "diesel-rs/diesel",
             "hyperium/hyper",
             "rustls/rustls"
-        ],
-        "swift": [
+        ),
+        "swift": (
             "apple/swift",
             "vapor/vapor", 
             "Alamofire/Alamofire",
@@ -146,8 +166,8 @@ class Config:
             "realm/realm-swift",
             "onevcat/Kingfisher",
             "apple/swift-package-manager"
-        ],
-        "kotlin": [
+        ),
+        "kotlin": (
             "JetBrains/kotlin",
             "square/okhttp",
             "InsertKoinIO/koin",
@@ -155,8 +175,8 @@ class Config:
             "detekt/detekt",
             "mockk/mockk",
             "kotest/kotest"
-        ],
-        "ruby": [
+        ),
+        "ruby": (
             "rails/rails",
             "jekyll/jekyll",
             "github/gitignore",
@@ -164,8 +184,8 @@ class Config:
             "rspec/rspec",
             "sinatra/sinatra",
             "capistrano/capistrano"
-        ],
-        "php": [
+        ),
+        "php": (
             "laravel/laravel",
             "symfony/symfony",
             "composer/composer",
@@ -173,8 +193,8 @@ class Config:
             "guzzle/guzzle",
             "doctrine/orm",
             "phpstan/phpstan"
-        ],
-        "c++": [
+        ),
+        "c++": (
             "microsoft/calculator",
             "opencv/opencv",
             "tensorflow/tensorflow",
@@ -182,8 +202,8 @@ class Config:
             "google/googletest",
             "nlohmann/json",
             "fmtlib/fmt"
-        ],
-        "c#": [
+        ),
+        "c#": (
             "dotnet/core",
             "aspnet/AspNetCore",
             "NUnit/nunit",
@@ -191,20 +211,20 @@ class Config:
             "StackExchange/Dapper",
             "JamesNK/Newtonsoft.Json",
             "serilog/serilog"
-        ]
-    }
+        )
+    })
     
     @classmethod
-    def get_popular_repos_for_skill(cls, skill: str) -> List[str]:
-        """Get popular repositories for a given skill/language."""
-        return cls.POPULAR_REPOSITORIES.get(skill.lower(), [])
+    def get_popular_repos_for_skill(cls, skill: str) -> Tuple[str, ...]:
+        """Get popular repositories for a given lowercase skill/language."""
+        return cls.POPULAR_REPOSITORIES.get(skill, ())
     
     @classmethod
     def is_valid_issue_type(cls, issue_type: str) -> bool:
         """Check if an issue type is supported."""
-        return issue_type.lower() in cls.SUPPORTED_ISSUE_TYPES
+        return issue_type.lower() in cls._SUPPORTED_ISSUE_TYPES_SET
     
     @classmethod
     def is_valid_difficulty(cls, difficulty: str) -> bool:
         """Check if a difficulty level is valid."""
-        return difficulty.lower() in cls.DIFFICULTY_LEVELS
+        return difficulty.lower() in cls._DIFFICULTY_SET
@@ -0,0 +1,197 @@
+"""
+Async GitHub API client shared by the analyzer and issue matcher.
+"""
+import logging
+import re
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+import httpx
+from cachetools import LRUCache
+
+try:
+    import diskcache
+except ImportError:  # Optional; responses are then cached in memory only
+    diskcache = None
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Cached response: (etag, decoded body, expiry as a Unix timestamp)
+CacheEntry = Tuple[Optional[str], Any, float]
+
+_MAX_AGE_RE = re.compile(r"(?:^|,)\s*max-age=(\d+)")
+
+def _max_age(cache_control: str) -> float:
+    """Seconds a response may be served without revalidation, per its Cache-Control header."""
+    if "no-cache" in cache_control:
+        return 0
+    match = _MAX_AGE_RE.search(cache_control)
+    return float(match.group(1)) if match else 0
+
+class ResponseCache:
+    """Store for cached GitHub responses, on disk when configured and available."""
+
+    def __init__(self, directory: Optional[str] = None, max_entries: int = Config.GITHUB_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._disk = None
+        self._memory: LRUCache = LRUCache(maxsize=max_entries)
+
+        if directory:
+            if diskcache is not None:
+                self._disk = diskcache.Cache(directory)
+            else:
+                logger.warning("diskcache is not installed; caching GitHub responses in memory only.")
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return the cached entry for a key, stale or not."""
+        if self._disk is not None:
+            return self._disk.get(key)
+        return self._memory.get(key)
+
+    def set(self, key: str, entry: CacheEntry):
+        """Store an entry, evicting the least recently used in-memory entry when full."""
+        if self._disk is not None:
+            self._disk.set(key, entry)
+        else:
+            self._memory[key] = entry
+
+def create_http_client(token: Optional[str] = None) -> httpx.AsyncClient:
+    """Create a pooled HTTP/2 client for the GitHub API, authenticated when a token is given."""
+    headers = {"Accept": "application/vnd.github+json"}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+
+    return httpx.AsyncClient(
+        base_url=Config.GITHUB_API_BASE_URL,
+        headers=headers,
+        http2=True,
+        limits=httpx.Limits(
+            max_keepalive_connections=Config.MAX_KEEPALIVE_CONNECTIONS,
+            max_connections=Config.MAX_CONNECTIONS
+        ),
+        timeout=Config.HTTP_TIMEOUT
+    )
+
+class GhClient:
+    """Thin wrapper around a pooled HTTP/2 connection to the GitHub REST and GraphQL APIs."""
+
+    def __init__(self, token: Optional[str] = None, http: Optional[httpx.AsyncClient] = None):
+        self.token = token or Config.GITHUB_TOKEN
+        self.http = http or create_http_client(self.token)
+        self.cache = ResponseCache(Config.GITHUB_CACHE_DIR)
+
+    async def get(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        ttl: Optional[float] = None
+    ) -> Any:
+        """
+        Fetch a single API resource.
+
+        Responses are cached: fresh entries are served without a request, and
+        stale ones are revalidated with ``If-None-Match`` so an unchanged
+        resource costs a 304 that GitHub does not count against the rate limit.
+        Freshness comes from ``ttl`` or else the response's ``Cache-Control:
+        max-age``; ``no-store`` responses are never cached.
+
+        Args:
+            path: API path relative to the GitHub base URL
+            params: Optional query parameters
+            ttl: Seconds to serve the response from cache before revalidating,
+                overriding the response's own max-age
+
+        Returns:
+            Decoded JSON response body
+        """
+        key = f"gh:{path}?{urlencode(sorted(params.items()))}" if params else f"gh:{path}"
+        entry = self.cache.get(key)
+        now = time.time()
+
+        if entry and entry[2] > now:
+            return entry[1]
+
+        headers = {"If-None-Match": entry[0]} if entry and entry[0] else None
+        response = await self.http.get(path, params=params, headers=headers)
+
+        if response.status_code == 304 and entry:
+            etag, body = entry[0], entry[1]
+        else:
+            response.raise_for_status()
+            etag, body = response.headers.get("ETag"), response.json()
+
+        cache_control = response.headers.get("Cache-Control", "")
+        if "no-store" not in cache_control:
+            max_age = ttl if ttl is not None else _max_age(cache_control)
+            if etag or max_age > 0:
+                self.cache.set(key, (etag, body, now + max_age))
+        return body
+
+    async def paginate(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None
+    ) -> List[Any]:
+        """
+        Fetch pages of a list endpoint by following ``Link: rel="next"`` headers.
+
+        Args:
+            path: API path relative to the GitHub base URL
+            params: Optional query parameters for the first page
+            limit: Stop requesting pages once this many items have been collected
+
+        Returns:
+            Items from the fetched pages, in order (at most ``limit``)
+        """
+        items = []
+        url = path
+
+        while url and (limit is None or len(items) < limit):
+            response = await self.http.get(url, params=params)
+            response.raise_for_status()
+            items.extend(response.json())
+
+            # The next link already carries the full query string
+            next_link = response.links.get("next")
+            url = next_link["url"] if next_link else None
+            params = None
+
+        return items[:limit] if limit is not None else items
+
+    async def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Run a GraphQL v4 query. GitHub only serves GraphQL to authenticated clients.
+
+        Args:
+            query: GraphQL query document
+            variables: Values for the query's variables
+
+        Returns:
+            The ``data`` object of the response; fields that failed resolve to None
+        """
+        response = await self.http.post("/graphql", json={"query": query, "variables": variables or {}})
+        response.raise_for_status()
+        payload = response.json()
+
+        for error in payload.get("errors") or []:
+            logger.warning(f"GitHub GraphQL error: {error.get('message')}")
+
+        return payload.get("data") or {}
+
+    async def aclose(self):
+        """Close the underlying connection pool."""
+        await self.http.aclose()
+
+
+_shared_client: Optional[GhClient] = None
+
+def get_shared_client() -> GhClient:
+    """Return the process-wide GhClient, creating it on first use."""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = GhClient()
+    return _shared_client
@@ -3,28 +3,34 @@ GitHub profile analyzer for extracting user skills and experience.
 """
 import asyncio
 import logging
+from datetime import datetime
 from typing import Dict, List, Optional, Set
-import aiohttp
-from github import Github
-from github.GithubException import GithubException
-import os
+import httpx
 
 from models import UserSkills
-from skill_extractor import SkillExtractor
+from skill_extractor import DEFAULT_EXTRACTOR
+from gh_client import GhClient, get_shared_client
 from config import Config
 
 logger = logging.getLogger(__name__)
 
+# Markup and stylesheet languages don't count as programming skills
+_EXCLUDED_LANGS = frozenset({"html", "css", "scss", "less"})
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse a GitHub ISO 8601 timestamp (e.g. ``2024-01-01T12:00:00Z``)."""
+    return datetime.fromisoformat(value)
+
 class GitHubAnalyzer:
     """Analyzes GitHub profiles to extract user skills and experience."""
     
-    def __init__(self):
-        self.github_token = os.getenv("GITHUB_TOKEN")
-        if not self.github_token:
+    def __init__(self, client: Optional[GhClient] = None):
+        # Defaults to the process-wide client so requests reuse one connection pool
+        self.client = client or get_shared_client()
+        if not self.client.token:
             logger.warning("No GitHub token provided. API rate limits will be severely restricted.")
         
-        self.github = Github(self.github_token) if self.github_token else Github()
-        self.skill_extractor = SkillExtractor()
+        self.skill_extractor = DEFAULT_EXTRACTOR
     
     async def analyze_user_skills(self, username: str) -> Optional[UserSkills]:
         """
@@ -37,22 +43,35 @@ class GitHubAnalyzer:
             UserSkills object with extracted skills or None if analysis fails
         """
         try:
-            user = self.github.get_user(username)
+            user = await self.client.get(f"/users/{username}")
             
             # Get user's repositories
-            repos = list(user.get_repos(type="owner", sort="updated"))[:50]  # Limit to recent 50 repos
+            repos = await self.client.paginate(
+                f"/users/{username}/repos",
+                params={"type": "owner", "sort": "updated", "per_page": min(Config.MAX_REPOS_TO_ANALYZE, 100)},
+                limit=Config.MAX_REPOS_TO_ANALYZE  # Limit to recent repos
+            )
             
             if not repos:
                 logger.warning(f"No repositories found for user {username}")
                 return None
             
+            # Profile statistics, computed once and reused for the experience estimate
+            user_updated_at = _parse_timestamp(user["updated_at"])
+            github_stats = {
+                "public_repos": user["public_repos"],
+                "followers": user["followers"],
+                "following": user["following"],
+                "account_age_years": (user_updated_at - _parse_timestamp(user["created_at"])).days / 365.25
+            }
+            
             # Extract skills from repositories
             languages = await self._extract_languages(repos)
             technologies = await self._extract_technologies(repos)
-            experience_level = await self._estimate_experience_level(user, repos)
+            experience_level = self._estimate_experience_level(github_stats, repos, user_updated_at)
             
             # Get additional context from profile
-            bio_skills = self._extract_skills_from_bio(user.bio or "")
+            bio_skills = self._extract_skills_from_bio(user.get("bio") or "")
             
             # Combine all skills
             all_languages = languages.union(bio_skills.get("languages", set()))
@@ -62,34 +81,49 @@ class GitHubAnalyzer:
                 languages=list(all_languages),
                 technologies=list(all_technologies),
                 experience_level=experience_level,
-                github_stats={
-                    "public_repos": user.public_repos,
-                    "followers": user.followers,
-                    "following": user.following,
-                    "account_age_years": (user.updated_at - user.created_at).days / 365.25
-                }
+                github_stats=github_stats
             )
             
-        except GithubException as e:
+        except httpx.HTTPError as e:
             logger.error(f"GitHub API error for user {username}: {e}")
             return None
         except Exception as e:
             logger.error(f"Error analyzing user {username}: {e}")
             return None
     
+    async def _fetch_repo_resource(self, repos, resource: str) -> List:
+        """
+        Fetch ``/repos/{owner}/{repo}/{resource}`` for every repository concurrently.
+        
+        Returns:
+            One decoded response per repository, or the exception raised fetching it
+        """
+        semaphore = asyncio.Semaphore(Config.MAX_CONCURRENT_REQUESTS)
+        
+        async def fetch(repo):
+            async with semaphore:
+                return await self.client.get(
+                    f"/repos/{repo['full_name']}/{resource}",
+                    ttl=Config.REPO_METADATA_CACHE_TTL
+                )
+        
+        return await asyncio.gather(*map(fetch, repos), return_exceptions=True)
+    
     async def _extract_languages(self, repos) -> Set[str]:
         """Extract programming languages from repositories."""
         languages = set()
         
-        for repo in repos:
-            try:
-                repo_languages = repo.get_languages()
-                for lang in repo_languages.keys():
-                    if lang and lang.lower() not in ["html", "css"]:  # Filter out markup languages
-                        languages.add(lang.lower())
-            except Exception as e:
-                logger.debug(f"Error getting languages for repo {repo.name}: {e}")
+        results = await self._fetch_repo_resource(repos, "languages")
+        
+        for repo, repo_languages in zip(repos, results):
+            if isinstance(repo_languages, Exception):
+                logger.debug(f"Error getting languages for repo {repo['name']}: {repo_languages}")
                 continue
+            
+            for lang in repo_languages.keys():
+                lang_lower = lang.lower()
+                if lang_lower and lang_lower not in _EXCLUDED_LANGS:
+                    languages.add(lang_lower)
         
         return languages
     
@@ -98,35 +132,44 @@ class GitHubAnalyzer:
         technologies = set()
         
         for repo in repos:
-            try:
-                # Extract from repository name
-                repo_techs = self.skill_extractor.extract_from_text(repo.name or "")
-                technologies.update(repo_techs)
-                
-                # Extract from description
-                if repo.description:
-                    desc_techs = self.skill_extractor.extract_from_text(repo.description)
-                    technologies.update(desc_techs)
-                
-                # Extract from topics
-                if hasattr(repo, 'get_topics'):
-                    topics = repo.get_topics()
-                    for topic in topics:
-                        if self.skill_extractor.is_technology(topic):
-                            technologies.add(topic.lower())
-                            
-            except Exception as e:
-                logger.debug(f"Error extracting technologies from repo {repo.name}: {e}")
+            # Extract from repository name
+            repo_techs = self.skill_extractor.extract_from_text(repo["name"] or "")
+            technologies.update(repo_techs)
+            
+            # Extract from description
+            if repo.get("description"):
+                desc_techs = self.skill_extractor.extract_from_text(repo["description"])
+                technologies.update(desc_techs)
+        
+        # Extract from topics
+        results = await self._fetch_repo_resource(repos, "topics")
+        
+        for repo, repo_topics in zip(repos, results):
+            if isinstance(repo_topics, Exception):
+                logger.debug(f"Error extracting technologies from repo {repo['name']}: {repo_topics}")
                 continue
+            
+            # GitHub only allows lowercase topics
+            for topic in repo_topics.get("names", []):
+                if self.skill_extractor.is_known_lowercase(topic):
+                    technologies.add(topic)
         
         return technologies
     
-    async def _estimate_experience_level(self, user, repos) -> str:
-        """Estimate user's experience level based on GitHub activity."""
+    def _estimate_experience_level(self, stats: Dict, repos, user_updated_at: datetime) -> str:
+        """
+        Estimate user's experience level based on GitHub activity.
+        
+        Args:
+            stats: Profile statistics built by analyze_user_skills
+            repos: User's repositories, most recently updated first
+            user_updated_at: When the profile was last updated; repositories
+                updated within a year of this count as active
+        """
         try:
-            account_age = (user.updated_at - user.created_at).days / 365.25
-            total_repos = user.public_repos
-            followers = user.followers
+            account_age = stats["account_age_years"]
+            total_repos = stats["public_repos"]
+            followers = stats["followers"]
             
             # Calculate a simple experience score
             score = 0
@@ -154,8 +197,8 @@ class GitHubAnalyzer:
                 score += 1
             
             # Repository activity analysis
-            active_repos = [repo for repo in repos[:10] if repo.updated_at and 
-                          (user.updated_at - repo.updated_at).days <= 365]
+            active_repos = [repo for repo in repos[:10] if repo.get("updated_at") and 
+                          (user_updated_at - _parse_timestamp(repo["updated_at"])).days <= 365]
             
             if len(active_repos) >= 5:
                 score += 2
@@ -188,8 +231,9 @@ class GitHubAnalyzer:
         languages = set()
         technologies = set()
         
+        # Extracted skills are already lowercase
         for tech in extracted_techs:
-            if self.skill_extractor.is_programming_language(tech):
+            if tech in self.skill_extractor.programming_languages:
                 languages.add(tech)
             else:
                 technologies.add(tech)
@@ -2,40 +2,187 @@
 GitHub issue matcher that finds relevant issues based on user skills.
 """
 import asyncio
+import heapq
+import itertools
 import logging
-from typing import Dict, List, Optional, Set
-import aiohttp
-from github import Github
-from github.GithubException import GithubException
-import os
-from datetime import datetime, timedelta
+import re
+import time
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Set, Tuple
+from datetime import datetime
+from cachetools import TTLCache
+
+try:
+    import ahocorasick
+except ImportError:  # Optional accelerator; difficulty detection falls back to substring checks
+    ahocorasick = None
 
 from models import UserSkills, GitHubIssue
+from gh_client import GhClient, get_shared_client
 from config import Config
 
 logger = logging.getLogger(__name__)
 
+# Raw (unscored) search results keyed by the normalized set of searches
+_SEARCH_CACHE: TTLCache = TTLCache(maxsize=Config.SEARCH_CACHE_MAX_ENTRIES, ttl=Config.SEARCH_CACHE_TTL)
+
+# Fields fetched for every issue returned by a GraphQL search
+_ISSUE_FIELDS = """
+    nodes {
+        ... on Issue {
+            databaseId
+            number
+            title
+            body
+            url
+            createdAt
+            updatedAt
+            labels(first: 20) { nodes { name } }
+            repository { nameWithOwner url }
+        }
+    }
+"""
+
+# Difficulty implied by an issue label, as (priority, difficulty); lowest priority wins
+_LABEL_DIFFICULTY = {
+    **{label: (0, "beginner") for label in ("good first issue", "beginner", "easy", "starter")},
+    **{label: (1, "intermediate") for label in ("intermediate", "medium")},
+    **{label: (2, "expert") for label in ("hard", "expert", "complex", "difficult")},
+    "help wanted": (3, "intermediate"),
+    "bug": (4, "intermediate"),
+    **{label: (5, "intermediate") for label in ("enhancement", "feature")},
+}
+
+# Body text complexity indicators, checked in order
+_BODY_INDICATORS = (
+    ("beginner", ("simple", "easy", "basic", "straightforward", "minor")),
+    ("expert", ("complex", "advanced", "architecture", "performance", "optimization", "refactor")),
+)
+
+# Bonus for an issue's difficulty, by the user's experience level
+_DIFFICULTY_BONUS = {
+    "beginner": {"beginner": 2.0},
+    "intermediate": {"intermediate": 2.0, "beginner": 1.0},
+    "advanced": {"advanced": 2.0, "beginner": 1.0, "intermediate": 1.0},
+    "expert": {"expert": 2.0, "intermediate": 1.0},
+}
+
+def _build_body_automaton():
+    """Build an Aho-Corasick automaton over all body indicators, or None without pyahocorasick."""
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for priority, (difficulty, indicators) in enumerate(_BODY_INDICATORS):
+        for indicator in indicators:
+            automaton.add_word(indicator, (priority, difficulty))
+    automaton.make_automaton()
+    return automaton
+
+_BODY_AUTOMATON = _build_body_automaton()
+
+def _compile_skill_pattern(skills: List[str]) -> Optional[re.Pattern]:
+    """Compile one alternation matching any of the given lowercase skills as a whole word."""
+    if not skills:
+        return None
+    
+    # Longest first so e.g. "c++" wins over "c" at the same position
+    alternatives = "|".join(map(re.escape, sorted(skills, key=len, reverse=True)))
+    return re.compile(rf"(?<!\w)({alternatives})(?!\w)")
+
+class _IssueScorer:
+    """Scores issues for relevance to one user's skills; built once per matching request."""
+    
+    def __init__(self, user_skills: UserSkills):
+        level = user_skills.experience_level
+        self.gfi_bonus = 3.0 if level in ("beginner", "intermediate") else 0.0
+        self.difficulty_bonus = _DIFFICULTY_BONUS.get(level, {level: 2.0})
+        
+        # Skills are already lowercase (see UserSkills)
+        self.lang_re = _compile_skill_pattern([language for language in user_skills.languages if language])
+        self.tech_re = _compile_skill_pattern([tech for tech in user_skills.technologies if tech])
+        self.now_ts = time.time()
+    
+    def score(
+        self,
+        title: str,
+        body: str,
+        labels: List[str],
+        difficulty: str,
+        updated_at_ts: float
+    ) -> Tuple[float, List[str]]:
+        """
+        Score a single issue.
+        
+        Returns:
+            Relevance score and the user skills mentioned in the issue
+        """
+        score = 0.0
+        
+        # Check title and body for skill mentions in a single pass per group
+        content = f"{title} {body}".lower()
+        matched_langs = set(self.lang_re.findall(content)) if self.lang_re else set()
+        matched_techs = set(self.tech_re.findall(content)) if self.tech_re else set()
+        
+        # Skill matching score
+        score += 2.0 * len(matched_langs) + 1.5 * len(matched_techs)
+        matched_skills = matched_langs | matched_techs
+        
+        # Label-based scoring
+        for label in labels:
+            label_lower = label.lower()
+            if self.gfi_bonus and "good first issue" in label_lower:
+                score += self.gfi_bonus
+            elif "help wanted" in label_lower:
+                score += 2.0
+            elif "bug" in label_lower:
+                score += 1.0
+            elif "enhancement" in label_lower or "feature" in label_lower:
+                score += 1.5
+        
+        # Difficulty matching
+        score += self.difficulty_bonus.get(difficulty, 0.0)
+        
+        # Recency bonus
+        days_old = (self.now_ts - updated_at_ts) // 86400
+        if days_old <= 7:
+            score += 1.0
+        elif days_old <= 30:
+            score += 0.5
+        
+        return score, list(matched_skills)
+
+class _TopIssues:
+    """Keeps the highest-scoring unique issues seen so far in a bounded min-heap."""
+    
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._heap = []
+        self._seen_ids: Set[int] = set()
+        self._counter = itertools.count()
+    
+    def add(self, issue: GitHubIssue):
+        """Offer an issue, skipping it if already seen and evicting the lowest score when full."""
+        if issue.id in self._seen_ids:
+            return
+        self._seen_ids.add(issue.id)
+        
+        # Negated counter keeps earlier issues ahead on score ties
+        entry = (issue.relevance_score, -next(self._counter), issue)
+        if len(self._heap) < self.capacity:
+            heapq.heappush(self._heap, entry)
+        else:
+            heapq.heappushpop(self._heap, entry)
+    
+    def results(self) -> List[GitHubIssue]:
+        """Return the kept issues, highest score first."""
+        return [issue for _, _, issue in sorted(self._heap, reverse=True)]
+
 class IssueMatcher:
     """Matches GitHub issues with user skills and preferences."""
     
-    def __init__(self):
-        self.github_token = os.getenv("GITHUB_TOKEN")
-        self.github = Github(self.github_token) if self.github_token else Github()
-        
-        # Popular repositories for different languages/technologies
-        self.popular_repos = {
-            "python": ["python/cpython", "pallets/flask", "django/django", "fastapi/fastapi"],
-            "javascript": ["microsoft/vscode", "facebook/react", "vuejs/vue", "angular/angular"],
-            "java": ["spring-projects/spring-boot", "elastic/elasticsearch", "apache/kafka"],
-            "go": ["kubernetes/kubernetes", "golang/go", "docker/docker", "prometheus/prometheus"],
-            "rust": ["rust-lang/rust", "actix/actix-web", "tokio-rs/tokio"],
-            "typescript": ["microsoft/TypeScript", "nestjs/nest", "typeorm/typeorm"],
-            "c++": ["microsoft/calculator", "opencv/opencv", "tensorflow/tensorflow"],
-            "ruby": ["rails/rails", "jekyll/jekyll", "github/gitignore"],
-            "php": ["laravel/laravel", "symfony/symfony", "composer/composer"],
-            "swift": ["apple/swift", "vapor/vapor", "Alamofire/Alamofire"],
-            "kotlin": ["JetBrains/kotlin", "square/okhttp", "InsertKoinIO/koin"]
-        }
+    def __init__(self, client: Optional[GhClient] = None):
+        self.client: GhClient = client or get_shared_client()
     
     async def find_matching_issues(
         self, 
@@ -54,180 +201,305 @@ class IssueMatcher:
         Returns:
             List of matching GitHub issues with relevance scores
         """
-        if issue_types is None:
-            issue_types = ["good first issue", "help wanted", "bug", "enhancement"]
+        searches = self._plan_searches(user_skills, issue_types, max_results)
+        if not searches:
+            return []
         
-        all_issues = []
+        scorer = _IssueScorer(user_skills)
+        top_issues = _TopIssues(max_results)
         
         try:
-            # Search by languages
-            for language in user_skills.languages[:5]:  # Limit to top 5 languages
-                language_issues = await self._search_issues_by_language(
-                    language, issue_types, max_results // len(user_skills.languages[:5])
-                )
-                all_issues.extend(language_issues)
-            
-            # Search by technologies
-            for tech in user_skills.technologies[:3]:  # Limit to top 3 technologies
-                tech_issues = await self._search_issues_by_technology(
-                    tech, issue_types, max_results // max(len(user_skills.technologies[:3]), 1)
-                )
-                all_issues.extend(tech_issues)
-            
-            # Remove duplicates and score issues
-            unique_issues = self._remove_duplicates(all_issues)
-            scored_issues = self._score_issues(unique_issues, user_skills)
+            # Issues are deduplicated, scored and ranked in a single pass as they arrive
+            async for issue in self._iter_issues(searches, scorer):
+                top_issues.add(issue)
             
-            # Sort by relevance score and return top results
-            scored_issues.sort(key=lambda x: x.relevance_score, reverse=True)
-            return scored_issues[:max_results]
+            return top_issues.results()
             
         except Exception as e:
             logger.error(f"Error finding matching issues: {e}")
             return []
     
-    async def _search_issues_by_language(
-        self, 
-        language: str, 
-        issue_types: List[str], 
-        limit: int
-    ) -> List[GitHubIssue]:
-        """Search for issues in repositories that use a specific language."""
-        issues = []
+    async def iter_matching_issues(
+        self,
+        user_skills: UserSkills,
+        issue_types: Optional[List[str]] = None,
+        max_results: int = 20
+    ) -> AsyncIterator[GitHubIssue]:
+        """
+        Yield GitHub issues that match user's skills as soon as each one is scored.
+        
+        Runs the same searches as find_matching_issues, but issues come out in
+        the order their searches complete rather than ranked by relevance.
+        
+        Args:
+            user_skills: User's programming skills and experience
+            issue_types: Types of issues to search for (e.g., "good first issue")
+            max_results: Stop after this many distinct issues
+        """
+        searches = self._plan_searches(user_skills, issue_types, max_results)
+        if not searches:
+            return
+        
+        scorer = _IssueScorer(user_skills)
+        seen_ids: Set[int] = set()
         
         try:
-            # Search in popular repositories for this language
-            repos_to_search = self.popular_repos.get(language.lower(), [])
-            
-            # Also search generally by language
-            query_parts = [f"language:{language}"]
-            
-            for issue_type in issue_types:
-                query_parts.append(f'label:"{issue_type}"')
-            
-            query = " ".join(query_parts) + " state:open"
-            
-            search_results = self.github.search_issues(
-                query=query,
-                sort="updated",
-                order="desc"
-            )
-            
-            count = 0
-            for issue in search_results:
-                if count >= limit:
-                    break
-                
-                try:
-                    github_issue = await self._convert_to_github_issue(issue, language)
-                    if github_issue:
-                        issues.append(github_issue)
-                        count += 1
-                except Exception as e:
-                    logger.debug(f"Error processing issue {issue.number}: {e}")
-                    continue
+            # Closed explicitly so stopping early cancels the searches still running
+            async with aclosing(self._iter_issues(searches, scorer)) as issues:
+                async for issue in issues:
+                    if issue.id in seen_ids:
+                        continue
+                    
+                    seen_ids.add(issue.id)
+                    yield issue
+                    if len(seen_ids) >= max_results:
+                        return
+                    
+        except Exception as e:
+            logger.error(f"Error streaming matching issues: {e}")
+    
+    def _plan_searches(
+        self,
+        user_skills: UserSkills,
+        issue_types: Optional[List[str]],
+        max_results: int
+    ) -> List[Tuple[str, int]]:
+        """Build the (query, limit) searches for a user; empty when there is nothing to search for."""
+        if issue_types is None:
+            issue_types = ["good first issue", "help wanted", "bug", "enhancement"]
+        
+        languages = user_skills.languages[:5]  # Limit to top 5 languages
+        technologies = user_skills.technologies[:3]  # Limit to top 3 technologies
+        
+        if max_results < 1 or (not languages and not technologies):
+            return []
+        
+        # Per-search quotas, so each source contributes without overshooting max_results
+        per_language = max(2, max_results // max(len(languages), 1))
+        per_repo = min(5, per_language)  # Limit per popular repository
+        per_technology = max(2, max_results // max(len(technologies), 1))
+        
+        searches = []
+        for language in languages:
+            searches.append((self._build_language_query(language, issue_types), per_language))
             
             # Search in specific popular repositories
-            for repo_name in repos_to_search[:3]:  # Limit to 3 popular repos
-                try:
-                    repo = self.github.get_repo(repo_name)
-                    repo_issues = repo.get_issues(
-                        state="open",
-                        labels=[label for label in issue_types if label in ["good first issue", "help wanted", "bug"]]
-                    )
-                    
-                    repo_count = 0
-                    for issue in repo_issues:
-                        if repo_count >= 5:  # Limit per repository
-                            break
-                        
-                        github_issue = await self._convert_to_github_issue(issue, language)
-                        if github_issue:
-                            issues.append(github_issue)
-                            repo_count += 1
-                            
-                except Exception as e:
-                    logger.debug(f"Error searching repo {repo_name}: {e}")
-                    continue
+            for repo_name in Config.get_popular_repos_for_skill(language)[:3]:  # Limit to 3 popular repos
+                searches.append((self._build_repository_query(repo_name, issue_types), per_repo))
+        
+        for tech in technologies:
+            searches.append((self._build_technology_query(tech, issue_types), per_technology))
+        
+        return searches
+    
+    def _build_language_query(self, language: str, issue_types: List[str]) -> str:
+        """Build a search query for issues in repositories that use a specific language."""
+        query_parts = [f"language:{language}"]
+        
+        for issue_type in issue_types:
+            query_parts.append(f'label:"{issue_type}"')
+        
+        return " ".join(query_parts) + " is:issue state:open sort:updated-desc"
+    
+    def _build_technology_query(self, technology: str, issue_types: List[str]) -> str:
+        """Build a search query for issues related to a specific technology or framework."""
+        query_parts = [f'"{technology}" in:title,body']
+        
+        for issue_type in issue_types:
+            query_parts.append(f'label:"{issue_type}"')
+        
+        return " ".join(query_parts) + " is:issue state:open sort:updated-desc"
+    
+    def _build_repository_query(self, repo_name: str, issue_types: List[str]) -> str:
+        """Build a search query for open issues in one repository with any of the contributor-friendly labels."""
+        labels = [label for label in issue_types if label in ["good first issue", "help wanted", "bug"]]
+        query = f"repo:{repo_name}"
+        
+        if labels:
+            # Comma-separated values are ORed, unlike repeated label: qualifiers
+            query += " label:" + ",".join(f'"{label}"' for label in labels)
+        
+        return query + " is:issue state:open sort:created-desc"
+    
+    async def _iter_issues(
+        self,
+        searches: List[Tuple[str, int]],
+        scorer: _IssueScorer
+    ) -> AsyncIterator[GitHubIssue]:
+        """
+        Run several issue searches at once, yielding scored issues as results arrive.
+        
+        Args:
+            searches: (query, limit) pairs
+            scorer: Scorer for the requesting user
+        """
+        if not searches:
+            return
+        
+        # Raw search results are shared between users with the same searches; scoring is per user
+        cache_key = frozenset(searches)
+        cached_nodes = _SEARCH_CACHE.get(cache_key)
+        if cached_nodes is not None:
+            for issue in self._issues_from_nodes(cached_nodes, scorer):
+                yield issue
+            return
+        
+        all_nodes = []
+        complete = True
+        
+        async for nodes in self._run_searches(searches):
+            if nodes is None:
+                complete = False
+                continue
             
+            all_nodes.extend(nodes)
+            for issue in self._issues_from_nodes(nodes, scorer):
+                yield issue
+        
+        # Don't let a failed search hide results for the whole TTL
+        if complete:
+            _SEARCH_CACHE[cache_key] = all_nodes
+    
+    async def _run_searches(self, searches: List[Tuple[str, int]]) -> AsyncIterator[Optional[List[Dict[str, Any]]]]:
+        """Yield the issue nodes of each search as it completes, or None for a failed search."""
+        if self.client.token:
+            # Several small GraphQL queries resolve in parallel rather than one large one in series
+            size = Config.GRAPHQL_SEARCHES_PER_QUERY
+            batches = [searches[i:i + size] for i in range(0, len(searches), size)]
+        else:
+            # GraphQL requires authentication; fall back to one REST search per query
+            batches = [[search] for search in searches]
+        
+        semaphore = asyncio.Semaphore(Config.MAX_CONCURRENT_REQUESTS)
+        
+        async def run(batch):
+            async with semaphore:
+                if self.client.token:
+                    return await self._search_issues_graphql(batch)
+                return [await self._search_issues_rest(*batch[0])]
+        
+        tasks = [asyncio.ensure_future(run(batch)) for batch in batches]
+        try:
+            for next_batch in asyncio.as_completed(tasks):
+                for nodes in await next_batch:
+                    yield nodes
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    def _issues_from_nodes(self, nodes: List[Dict[str, Any]], scorer: _IssueScorer) -> Iterator[GitHubIssue]:
+        """Convert issue nodes lazily, skipping ones that fail to convert."""
+        for node in nodes:
+            issue = self._issue_from_node(node, scorer)
+            if issue:
+                yield issue
+    
+    async def _search_issues_graphql(
+        self,
+        searches: List[Tuple[str, int]]
+    ) -> List[Optional[List[Dict[str, Any]]]]:
+        """Run all searches as aliased fields of one GraphQL query; failed searches come back as None."""
+        variable_defs = []
+        fields = []
+        variables = {}
+        
+        for i, (query, limit) in enumerate(searches):
+            if limit < 1:
+                continue
+            variable_defs.append(f"$q{i}: String!, $n{i}: Int!")
+            fields.append(f"s{i}: search(query: $q{i}, type: ISSUE, first: $n{i}) {{ {_ISSUE_FIELDS} }}")
+            variables[f"q{i}"] = query
+            variables[f"n{i}"] = min(limit, 100)
+        
+        if not fields:
+            return [[] for _ in searches]
+        
+        document = f"query({', '.join(variable_defs)}) {{ {' '.join(fields)} }}"
+        try:
+            data = await self.client.graphql(document, variables)
         except Exception as e:
-            logger.error(f"Error searching issues by language {language}: {e}")
+            logger.error(f"Error running GraphQL issue search: {e}")
+            data = {}
         
-        return issues
+        results = []
+        for i, (_, limit) in enumerate(searches):
+            if limit < 1:
+                results.append([])
+            elif data.get(f"s{i}") is None:
+                results.append(None)
+            else:
+                results.append(data[f"s{i}"].get("nodes", []))
+        
+        return results
     
-    async def _search_issues_by_technology(
-        self, 
-        technology: str, 
-        issue_types: List[str], 
-        limit: int
-    ) -> List[GitHubIssue]:
-        """Search for issues related to a specific technology or framework."""
-        issues = []
+    async def _search_issues_rest(self, query: str, limit: int) -> Optional[List[Dict[str, Any]]]:
+        """Run one search through the REST API, returning GraphQL-shaped issue nodes or None on failure."""
+        if limit < 1:
+            return []
         
         try:
-            # Build search query
-            query_parts = [f'"{technology}" in:title,body']
-            
-            for issue_type in issue_types:
-                query_parts.append(f'label:"{issue_type}"')
-            
-            query = " ".join(query_parts) + " state:open"
-            
-            search_results = self.github.search_issues(
-                query=query,
-                sort="updated",
-                order="desc"
+            data = await self.client.get(
+                "/search/issues",
+                params={"q": query, "per_page": min(limit, 100)}
             )
-            
-            count = 0
-            for issue in search_results:
-                if count >= limit:
-                    break
-                
-                try:
-                    github_issue = await self._convert_to_github_issue(issue, technology)
-                    if github_issue:
-                        issues.append(github_issue)
-                        count += 1
-                except Exception as e:
-                    logger.debug(f"Error processing issue {issue.number}: {e}")
-                    continue
-                    
         except Exception as e:
-            logger.error(f"Error searching issues by technology {technology}: {e}")
+            logger.error(f"Error searching issues for query {query!r}: {e}")
+            return None
+        
+        nodes = []
+        for item in data.get("items", []):
+            repository_name = item["repository_url"].split("/repos/", 1)[1]
+            nodes.append({
+                "databaseId": item["id"],
+                "number": item["number"],
+                "title": item["title"],
+                "body": item.get("body"),
+                "url": item["html_url"],
+                "createdAt": item["created_at"],
+                "updatedAt": item["updated_at"],
+                "labels": {"nodes": [{"name": label["name"]} for label in item.get("labels", [])]},
+                "repository": {
+                    "nameWithOwner": repository_name,
+                    "url": f"https://github.com/{repository_name}"
+                }
+            })
         
-        return issues
+        return nodes
     
-    async def _convert_to_github_issue(self, issue, matched_skill: str) -> Optional[GitHubIssue]:
-        """Convert GitHub API issue to our GitHubIssue model."""
+    def _issue_from_node(
+        self,
+        node: Dict[str, Any],
+        scorer: _IssueScorer
+    ) -> Optional[GitHubIssue]:
+        """Convert a GraphQL issue node to a scored GitHubIssue."""
+        if not node:  # Pull requests come back as empty objects
+            return None
+        
         try:
-            # Skip pull requests
-            if hasattr(issue, 'pull_request') and issue.pull_request:
-                return None
-            
-            # Get labels
-            labels = [label.name for label in issue.labels] if hasattr(issue, 'labels') else []
-            
-            # Determine difficulty
-            difficulty = self._determine_difficulty(labels, issue.body or "")
-            
-            # Get repository info
-            repo = issue.repository
+            labels = [label["name"] for label in node["labels"]["nodes"]]
+            body = node.get("body") or ""
+            repo = node["repository"]
+            difficulty = self._determine_difficulty(labels, body)
+            updated_at_ts = datetime.fromisoformat(node["updatedAt"]).timestamp()
+            relevance_score, matched_skills = scorer.score(
+                node["title"], body, labels, difficulty, updated_at_ts
+            )
             
             return GitHubIssue(
-                id=issue.id,
-                number=issue.number,
-                title=issue.title,
-                body=issue.body or "",
-                url=issue.html_url,
-                repository_name=repo.full_name,
-                repository_url=repo.html_url,
+                id=node["databaseId"],
+                number=node["number"],
+                title=node["title"],
+                body=body,
+                url=node["url"],
+                repository_name=repo["nameWithOwner"],
+                repository_url=repo["url"],
                 labels=labels,
-                created_at=issue.created_at.isoformat(),
-                updated_at=issue.updated_at.isoformat(),
+                created_at=node["createdAt"],
+                updated_at=node["updatedAt"],
+                updated_at_ts=updated_at_ts,
                 difficulty=difficulty,
-                matched_skills=[matched_skill],
-                relevance_score=0.0  # Will be calculated later
+                matched_skills=matched_skills,
+                relevance_score=relevance_score
             )
             
         except Exception as e:
@@ -236,99 +508,26 @@ class IssueMatcher:
     
     def _determine_difficulty(self, labels: List[str], body: str) -> str:
         """Determine issue difficulty based on labels and content."""
-        labels_lower = [label.lower() for label in labels]
-        body_lower = body.lower()
-        
         # Check for explicit difficulty labels
-        if any(label in labels_lower for label in ["good first issue", "beginner", "easy", "starter"]):
-            return "beginner"
-        elif any(label in labels_lower for label in ["intermediate", "medium"]):
-            return "intermediate"
-        elif any(label in labels_lower for label in ["hard", "expert", "complex", "difficult"]):
-            return "expert"
-        elif any(label in labels_lower for label in ["help wanted"]):
-            return "intermediate"
-        elif any(label in labels_lower for label in ["bug"]):
-            return "intermediate"
-        elif any(label in labels_lower for label in ["enhancement", "feature"]):
-            return "intermediate"
+        label_matches = [match for match in map(_LABEL_DIFFICULTY.get, map(str.lower, labels)) if match]
+        if label_matches:
+            return min(label_matches)[1]
         
         # Analyze body content for complexity indicators
-        complexity_indicators = {
-            "beginner": ["simple", "easy", "basic", "straightforward", "minor"],
-            "expert": ["complex", "advanced", "architecture", "performance", "optimization", "refactor"]
-        }
+        body_lower = body.lower()
         
-        for difficulty, indicators in complexity_indicators.items():
-            if any(indicator in body_lower for indicator in indicators):
-                return difficulty
+        if _BODY_AUTOMATON is not None:
+            best = None
+            for _, match in _BODY_AUTOMATON.iter(body_lower):
+                if best is None or match < best:
+                    best = match
+                    if best[0] == 0:
+                        break
+            if best:
+                return best[1]
+        else:
+            for difficulty, indicators in _BODY_INDICATORS:
+                if any(indicator in body_lower for indicator in indicators):
+                    return difficulty
         
         return "intermediate"  # Default
-    
-    def _remove_duplicates(self, issues: List[GitHubIssue]) -> List[GitHubIssue]:
-        """Remove duplicate issues from the list."""
-        seen_ids = set()
-        unique_issues = []
-        
-        for issue in issues:
-            if issue.id not in seen_ids:
-                seen_ids.add(issue.id)
-                unique_issues.append(issue)
-        
-        return unique_issues
-    
-    def _score_issues(self, issues: List[GitHubIssue], user_skills: UserSkills) -> List[GitHubIssue]:
-        """Score issues based on relevance to user skills."""
-        for issue in issues:
-            score = 0.0
-            
-            # Skill matching score
-            matched_skills = set()
-            
-            # Check title and body for skill mentions
-            content = (issue.title + " " + issue.body).lower()
-            
-            for language in user_skills.languages:
-                if language.lower() in content:
-                    score += 2.0
-                    matched_skills.add(language)
-            
-            for tech in user_skills.technologies:
-                if tech.lower() in content:
-                    score += 1.5
-                    matched_skills.add(tech)
-            
-            # Label-based scoring
-            for label in issue.labels:
-                label_lower = label.lower()
-                if "good first issue" in label_lower and user_skills.experience_level in ["beginner", "intermediate"]:
-                    score += 3.0
-                elif "help wanted" in label_lower:
-                    score += 2.0
-                elif "bug" in label_lower:
-                    score += 1.0
-                elif "enhancement" in label_lower or "feature" in label_lower:
-                    score += 1.5
-            
-            # Difficulty matching
-            if issue.difficulty == user_skills.experience_level:
-                score += 2.0
-            elif (issue.difficulty == "beginner" and user_skills.experience_level in ["intermediate", "advanced"]) or \
-                 (issue.difficulty == "intermediate" and user_skills.experience_level in ["advanced", "expert"]):
-                score += 1.0
-            
-            # Recency bonus
-            try:
-                updated_date = datetime.fromisoformat(issue.updated_at.replace('Z', '+00:00'))
-                days_old = (datetime.now().replace(tzinfo=updated_date.tzinfo) - updated_date).days
-                if days_old <= 7:
-                    score += 1.0
-                elif days_old <= 30:
-                    score += 0.5
-            except:
-                pass
-            
-            issue.relevance_score = score
-            issue.matched_skills = list(matched_skills)
-        
-        return issues
@@ -1,6 +1,6 @@
 
-import asyncio
 import logging
+import uvloop
 from mcp_server import MCPGitHubIssueServer
 
 # Configure logging
@@ -22,6 +22,8 @@ async def main():
             app=server.app,
             host='0.0.0.0',
             port=5000,
+            loop='uvloop',
+            http='httptools',
             log_level='info'
         )
         server_instance = uvicorn.Server(config)
@@ -31,4 +33,5 @@ async def main():
         raise
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    # serve() runs on the caller's loop, so uvloop has to be installed here
+    uvloop.run(main())
@@ -4,18 +4,50 @@ MCP Server implementation for GitHub issue matching.
 import asyncio
 import json
 import logging
-from typing import Any, Dict, List, Optional
-from fastapi import FastAPI, HTTPException
+from contextlib import asynccontextmanager
+from hashlib import blake2b
+from typing import Any, Dict, List, Optional, Tuple
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
+from cachetools import TTLCache
+import httpx
 import uvicorn
 
+from gh_client import GhClient
 from github_analyzer import GitHubAnalyzer
 from issue_matcher import IssueMatcher
-from models import SkillMatchRequest, IssueMatchResponse, UserSkills
+from models import SkillMatchRequest, UsernameMatchRequest, IssueMatchResponse, UserSkills
 from config import Config
 
 logger = logging.getLogger(__name__)
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an ``If-None-Match`` header against a strong ETag (weak comparison, per RFC 9110)."""
+    if not if_none_match:
+        return False
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return any(tag == etag or tag == "*" for tag in candidates)
+
+def _static_json(payload: Dict[str, Any]) -> Tuple[bytes, str]:
+    """Serialize a constant JSON payload once, returning the body and its ETag."""
+    body = json.dumps(payload, separators=(",", ":")).encode()
+    return body, f'"{blake2b(body, digest_size=16).hexdigest()}"'
+
+def _static_response(request: Request, body: bytes, etag: str) -> Response:
+    """Serve a precomputed JSON body, or 304 if the client already has it."""
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+# Responses that never change, serialized at import rather than per request
+_ROOT_BODY, _ROOT_ETAG = _static_json({
+    "name": "MCP GitHub Issue Matcher",
+    "version": "1.0.0",
+    "description": "Match users with relevant GitHub issues based on skills"
+})
+_HEALTH_BODY, _HEALTH_ETAG = _static_json({"status": "healthy", "service": "mcp-github-issue-matcher"})
+
 class MCPGitHubIssueServer:
     """MCP server for matching GitHub issues with user skills."""
     
@@ -23,22 +55,69 @@ class MCPGitHubIssueServer:
         self.app = FastAPI(
             title="MCP GitHub Issue Matcher",
             description="Match users with relevant GitHub issues based on skills",
-            version="1.0.0"
+            version="1.0.0",
+            lifespan=self._lifespan
+        )
+        # Created in _lifespan, once the server's event loop is running
+        self.github_analyzer: Optional[GitHubAnalyzer] = None
+        self.issue_matcher: Optional[IssueMatcher] = None
+        
+        # Recently analyzed users, and analyses still running, keyed by lowercase username
+        self._skills_cache: TTLCache = TTLCache(
+            maxsize=Config.USER_SKILLS_CACHE_MAX_ENTRIES,
+            ttl=Config.USER_SKILLS_CACHE_TTL
         )
-        self.github_analyzer = GitHubAnalyzer()
-        self.issue_matcher = IssueMatcher()
+        self._inflight: Dict[str, asyncio.Future] = {}
         self._setup_routes()
     
+    @asynccontextmanager
+    async def _lifespan(self, app: FastAPI):
+        """Share one pooled GitHub connection between all requests for the server's lifetime."""
+        client = GhClient()
+        app.state.http = client.http
+        self.github_analyzer = GitHubAnalyzer(client)
+        self.issue_matcher = IssueMatcher(client)
+        try:
+            yield
+        finally:
+            await client.aclose()
+    
+    async def _get_user_skills(self, username: str) -> Optional[UserSkills]:
+        """
+        Analyze a user's GitHub skills, sharing the work between concurrent requests.
+        
+        A recent successful result is served from cache; otherwise requests for
+        the same user await a single in-flight analysis.
+        
+        Args:
+            username: GitHub username to analyze
+            
+        Returns:
+            UserSkills object or None if analysis fails
+        """
+        key = username.lower()
+        user_skills = self._skills_cache.get(key)
+        if user_skills is not None:
+            return user_skills
+        
+        analysis = self._inflight.get(key)
+        if analysis is None:
+            analysis = asyncio.ensure_future(self.github_analyzer.analyze_user_skills(username))
+            self._inflight[key] = analysis
+            analysis.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        # Shielded so one client disconnecting does not cancel the others' analysis
+        user_skills = await asyncio.shield(analysis)
+        if user_skills is not None:
+            self._skills_cache[key] = user_skills
+        return user_skills
+    
     def _setup_routes(self):
         """Setup FastAPI routes for the MCP server."""
         
         @self.app.get("/")
-        async def root():
-            return {
-                "name": "MCP GitHub Issue Matcher",
-                "version": "1.0.0",
-                "description": "Match users with relevant GitHub issues based on skills"
-            }
+        async def root(request: Request):
+            return _static_response(request, _ROOT_BODY, _ROOT_ETAG)
         
         @self.app.post("/match-issues-by-skills", response_model=IssueMatchResponse)
         async def match_issues_by_skills(request: SkillMatchRequest):
@@ -66,20 +145,47 @@ class MCPGitHubIssueServer:
                     message=f"Found {len(issues)} matching issues"
                 )
                 
-            except Exception as e:
-                logger.error(f"Error matching issues by skills: {e}")
+            except HTTPException:
+                raise
+            except (httpx.HTTPError, ValueError) as e:
+                logger.error(f"Error matching issues by skills: {e}", exc_info=Config.DEBUG)
                 raise HTTPException(status_code=500, detail=str(e))
         
+        @self.app.post("/match-issues-by-skills/stream")
+        async def stream_issues_by_skills(request: SkillMatchRequest):
+            """Stream issues matching the provided skills as NDJSON, one issue per line as it is found."""
+            if not request.skills:
+                raise HTTPException(status_code=400, detail="Skills list cannot be empty")
+            
+            user_skills = UserSkills(
+                languages=request.skills,
+                technologies=[],
+                experience_level=request.experience_level or "intermediate"
+            )
+            
+            issues = self.issue_matcher.iter_matching_issues(
+                user_skills=user_skills,
+                issue_types=request.issue_types or ["good first issue", "help wanted"],
+                max_results=request.max_results or 20
+            )
+            
+            async def lines():
+                async for issue in issues:
+                    yield issue.model_dump_json() + "\n"
+            
+            return StreamingResponse(lines(), media_type="application/x-ndjson")
+        
         @self.app.post("/match-issues-by-username", response_model=IssueMatchResponse)
-        async def match_issues_by_username(request: Dict[str, Any]):
+        async def match_issues_by_username(request: UsernameMatchRequest):
             """Match issues based on GitHub username analysis."""
             try:
-                username = request.get("username")
+                # A missing username is already rejected with 422 by request validation
+                username = request.username
                 if not username:
                     raise HTTPException(status_code=400, detail="Username is required")
                 
                 # Analyze user's GitHub profile
-                user_skills = await self.github_analyzer.analyze_user_skills(username)
+                user_skills = await self._get_user_skills(username)
                 if not user_skills:
                     raise HTTPException(
                         status_code=404, 
@@ -89,8 +195,8 @@ class MCPGitHubIssueServer:
                 # Find matching issues
                 issues = await self.issue_matcher.find_matching_issues(
                     user_skills=user_skills,
-                    issue_types=request.get("issue_types", ["good first issue", "help wanted"]),
-                    max_results=request.get("max_results", 20)
+                    issue_types=request.issue_types or ["good first issue", "help wanted"],
+                    max_results=request.max_results or 20
                 )
                 
                 return IssueMatchResponse(
@@ -103,46 +209,67 @@ class MCPGitHubIssueServer:
                 
             except HTTPException:
                 raise
-            except Exception as e:
-                logger.error(f"Error matching issues by username: {e}")
+            except (httpx.HTTPError, ValueError) as e:
+                logger.error(f"Error matching issues by username: {e}", exc_info=Config.DEBUG)
                 raise HTTPException(status_code=500, detail=str(e))
         
         @self.app.get("/analyze-user/{username}")
-        async def analyze_user_skills(username: str):
+        async def analyze_user_skills(username: str, request: Request):
             """Analyze a GitHub user's skills without matching issues."""
             try:
-                user_skills = await self.github_analyzer.analyze_user_skills(username)
+                user_skills = await self._get_user_skills(username)
                 if not user_skills:
                     raise HTTPException(
                         status_code=404,
                         detail=f"Could not find or analyze user '{username}'"
                     )
                 
-                return {
+                # Already JSON-safe, so skip FastAPI's jsonable_encoder pass
+                response = JSONResponse({
                     "success": True,
                     "username": username,
-                    "skills": user_skills.dict(),
+                    "skills": user_skills.model_dump(mode="json", exclude_none=True),
                     "message": f"Successfully analyzed skills for @{username}"
-                }
+                })
+                
+                # Let clients revalidate cheaply instead of downloading the same analysis again
+                etag = f'"{blake2b(response.body, digest_size=16).hexdigest()}"'
+                headers = {"ETag": etag, "Cache-Control": Config.USER_SKILLS_CACHE_CONTROL}
+                if _etag_matches(request.headers.get("if-none-match"), etag):
+                    return Response(status_code=304, headers=headers)
+                
+                response.headers.update(headers)
+                return response
                 
             except HTTPException:
                 raise
-            except Exception as e:
-                logger.error(f"Error analyzing user skills: {e}")
+            except (httpx.HTTPError, ValueError) as e:
+                logger.error(f"Error analyzing user skills: {e}", exc_info=Config.DEBUG)
                 raise HTTPException(status_code=500, detail=str(e))
         
         @self.app.get("/health")
-        async def health_check():
+        async def health_check(request: Request):
             """Health check endpoint."""
-            return {"status": "healthy", "service": "mcp-github-issue-matcher"}
+            return _static_response(request, _HEALTH_BODY, _HEALTH_ETAG)
     
     async def run(self):
-        """Run the MCP server."""
+        """
+        Run the MCP server in a single process on the current event loop.
+        
+        Install uvloop as the loop first (e.g. ``uvloop.run(server.run())``);
+        for several worker processes use ``create_app`` with ``uvicorn --workers``.
+        """
         config = uvicorn.Config(
             app=self.app,
-            host="0.0.0.0",
-            port=8000,
+            host=Config.HOST,
+            port=Config.PORT,
+            loop="uvloop",
+            http="httptools",
             log_level="info"
         )
         server = uvicorn.Server(config)
         await server.serve()
+
+def create_app() -> FastAPI:
+    """Application factory, e.g. ``uvicorn mcp_server:create_app --factory --workers 4``."""
+    return MCPGitHubIssueServer().app
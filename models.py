@@ -2,18 +2,29 @@
 Data models for the MCP GitHub Issue Matcher.
 """
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from datetime import datetime
 
 class UserSkills(BaseModel):
     """User's programming skills and experience."""
+    # Read-only once built: analyzed skills are cached and shared between requests
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     languages: List[str] = Field(description="Programming languages the user knows")
     technologies: List[str] = Field(description="Technologies, frameworks, and tools")
     experience_level: str = Field(description="beginner, intermediate, advanced, or expert")
     github_stats: Optional[Dict[str, Any]] = Field(default=None, description="GitHub profile statistics")
+    
+    @field_validator("languages", "technologies")
+    @classmethod
+    def lowercase_skills(cls, skills: List[str]) -> List[str]:
+        """Normalize skills to lowercase so lookups and matching can compare them directly."""
+        return [skill.lower() for skill in skills]
 
 class GitHubIssue(BaseModel):
     """GitHub issue with relevance scoring."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     id: int = Field(description="GitHub issue ID")
     number: int = Field(description="Issue number in repository")
     title: str = Field(description="Issue title")
@@ -24,6 +35,7 @@ class GitHubIssue(BaseModel):
     labels: List[str] = Field(description="Issue labels")
     created_at: str = Field(description="Issue creation timestamp")
     updated_at: str = Field(description="Issue last update timestamp")
+    updated_at_ts: float = Field(default=0.0, exclude=True, description="Issue last update as a Unix timestamp")
     difficulty: str = Field(description="Estimated difficulty level")
     matched_skills: List[str] = Field(description="Skills that matched this issue")
     relevance_score: float = Field(description="Relevance score based on user skills")
@@ -49,6 +61,8 @@ class UsernameMatchRequest(BaseModel):
 
 class IssueMatchResponse(BaseModel):
     """Response model for issue matching results."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     success: bool = Field(description="Whether the operation was successful")
     issues: List[GitHubIssue] = Field(description="List of matching issues")
     total_found: int = Field(description="Total number of issues found")
@@ -63,5 +77,7 @@ class MCPToolCall(BaseModel):
 
 class MCPToolResult(BaseModel):
     """MCP tool result structure."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     content: List[Dict[str, Any]] = Field(description="Tool result content")
     isError: Optional[bool] = Field(default=False, description="Whether this is an error result")
@@ -2,24 +2,54 @@
 Skill extraction utilities for identifying programming languages and technologies.
 """
 import re
-from typing import List, Set
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import FrozenSet, List, Set
 import logging
 
 logger = logging.getLogger(__name__)
 
+def _vocabulary(terms: Set[str]) -> FrozenSet[str]:
+    """Freeze a vocabulary, interning its terms so lookups mostly compare by identity."""
+    return frozenset(map(sys.intern, terms))
+
+def _trie_regex(terms: Set[str]) -> str:
+    """
+    Build a regex alternation matching any of the terms, factored into a trie so
+    the engine follows one branch per character instead of retrying every term.
+    """
+    trie: dict = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}  # Marks the end of a term
+    
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if len(branches) == 1 and "" not in node:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if "" in node else group
+    
+    return build(trie)
+
 class SkillExtractor:
     """Extract and categorize programming skills from text."""
     
     def __init__(self):
-        self.programming_languages = {
+        self.programming_languages = _vocabulary({
             "python", "javascript", "java", "c++", "c#", "c", "go", "rust", "swift",
             "kotlin", "scala", "ruby", "php", "typescript", "dart", "r", "matlab",
             "perl", "lua", "haskell", "clojure", "elixir", "erlang", "f#", "pascal",
             "cobol", "fortran", "assembly", "bash", "shell", "powershell", "sql",
             "html", "css", "xml", "json", "yaml", "toml"
-        }
+        })
         
-        self.frameworks_libraries = {
+        self.frameworks_libraries = _vocabulary({
             "react", "angular", "vue", "svelte", "django", "flask", "fastapi", "express",
             "spring", "laravel", "rails", "asp.net", "blazor", "gatsby", "next.js",
             "nuxt.js", "electron", "react-native", "flutter", "ionic", "cordova",
@@ -27,21 +57,21 @@ class SkillExtractor:
             "opencv", "matplotlib", "seaborn", "plotly", "d3.js", "three.js",
             "bootstrap", "tailwind", "material-ui", "ant-design", "chakra-ui",
             "jquery", "lodash", "moment.js", "axios", "redux", "mobx", "rxjs"
-        }
+        })
         
-        self.databases = {
+        self.databases = _vocabulary({
             "mysql", "postgresql", "sqlite", "mongodb", "redis", "elasticsearch",
             "cassandra", "neo4j", "dynamodb", "firebase", "supabase", "prisma",
             "sequelize", "mongoose", "sqlalchemy", "hibernate", "entity-framework"
-        }
+        })
         
-        self.cloud_platforms = {
+        self.cloud_platforms = _vocabulary({
             "aws", "azure", "gcp", "google-cloud", "heroku", "netlify", "vercel",
             "digitalocean", "linode", "kubernetes", "docker", "jenkins", "gitlab-ci",
             "github-actions", "travis-ci", "circleci"
-        }
+        })
         
-        self.tools_technologies = {
+        self.tools_technologies = _vocabulary({
             "git", "github", "gitlab", "bitbucket", "jira", "confluence", "slack",
             "discord", "figma", "sketch", "adobe", "photoshop", "illustrator",
             "webpack", "vite", "parcel", "babel", "eslint", "prettier", "jest",
@@ -49,53 +79,35 @@ class SkillExtractor:
             "rest", "api", "microservices", "serverless", "jamstack", "pwa",
             "spa", "ssr", "ssg", "cms", "headless", "blockchain", "web3", "nft",
             "defi", "smart-contracts", "solidity", "ethereum", "bitcoin"
-        }
+        })
         
         # Combine all technology sets
         self.all_technologies = (
             self.frameworks_libraries | self.databases | 
             self.cloud_platforms | self.tools_technologies
         )
-    
-    def extract_from_text(self, text: str) -> Set[str]:
-        """
-        Extract technology keywords from text.
-        
-        Args:
-            text: Text to analyze
-            
-        Returns:
-            Set of identified technologies
-        """
-        if not text:
-            return set()
-        
-        text_lower = text.lower()
         
-        # Remove special characters and split into words
-        words = re.findall(r'\b\w+(?:[.-]\w+)*\b', text_lower)
-        
-        # Also check for common compound terms
-        compound_terms = [
+        # Category of every known skill; the first category listed wins
+        self._skill_to_category = {}
+        for vocabulary, category in (
+            (self.programming_languages, "languages"),
+            (self.frameworks_libraries, "frameworks"),
+            (self.databases, "databases"),
+            (self.cloud_platforms, "cloud"),
+            (self.tools_technologies, "tools")
+        ):
+            for skill in vocabulary:
+                self._skill_to_category.setdefault(skill, category)
+        
+        # Common compound terms
+        self.compound_terms = _vocabulary({
             "react-native", "next.js", "vue.js", "node.js", "asp.net",
             "material-ui", "ant-design", "chakra-ui", "github-actions",
             "gitlab-ci", "travis-ci", "google-cloud"
-        ]
-        
-        found_technologies = set()
-        
-        # Check individual words
-        for word in words:
-            if word in self.all_technologies or word in self.programming_languages:
-                found_technologies.add(word)
+        })
         
-        # Check compound terms
-        for term in compound_terms:
-            if term in text_lower:
-                found_technologies.add(term)
-        
-        # Special handling for common abbreviations and variations
-        text_variations = {
+        # Common abbreviations and variations, mapped to their canonical skill
+        self.text_variations = MappingProxyType({
             "js": "javascript",
             "ts": "typescript",
             "py": "python",
@@ -109,22 +121,53 @@ class SkillExtractor:
             "ai": "artificial-intelligence",
             "nlp": "natural-language-processing",
             "cv": "computer-vision"
+        })
+        
+        # Canonical skill for every term extract_from_text recognizes
+        self._canonical = {
+            term: term
+            for term in self.all_technologies | self.programming_languages | self.compound_terms
         }
+        self._canonical.update(self.text_variations)
+        
+        # Single-pass scanner for every term. A term only counts as a whole token,
+        # i.e. not preceded or followed by word characters or by a "." / "-"
+        # joining it to one (so "react" does not match inside "react-native").
+        self._term_re = re.compile(rf"(?<!\w)(?<!\w[.-])({_trie_regex(set(self._canonical))})(?![.-]?\w)")
+    
+    def extract_from_text(self, text: str) -> Set[str]:
+        """
+        Extract technology keywords from text.
+        
+        Args:
+            text: Text to analyze
+            
+        Returns:
+            Set of identified technologies
+        """
+        if not text:
+            return set()
         
-        for word in words:
-            if word in text_variations:
-                found_technologies.add(text_variations[word])
+        text_lower = text.lower()
+        found_technologies = {self._canonical[term] for term in self._term_re.findall(text_lower)}
         
+        # Compound terms count wherever they appear, e.g. inside "awesome-react-native"
+        found_technologies.update(term for term in self.compound_terms if term in text_lower)
         return found_technologies
     
+    def is_known_lowercase(self, tech: str) -> bool:
+        """Check an already-lowercase term against every vocabulary, without copying it."""
+        return tech in self._skill_to_category
+    
+    @lru_cache(maxsize=4096)
     def is_programming_language(self, tech: str) -> bool:
         """Check if a technology is a programming language."""
         return tech.lower() in self.programming_languages
     
+    @lru_cache(maxsize=4096)
     def is_technology(self, tech: str) -> bool:
         """Check if a string represents a known technology."""
-        return (tech.lower() in self.all_technologies or 
-                tech.lower() in self.programming_languages)
+        return self.is_known_lowercase(tech) or self.is_known_lowercase(tech.lower())
     
     def categorize_skills(self, skills: List[str]) -> dict:
         """
@@ -145,17 +188,16 @@ class SkillExtractor:
         }
         
         for skill in skills:
-            skill_lower = skill.lower()
-            
-            if skill_lower in self.programming_languages:
-                categorized["languages"].append(skill)
-            elif skill_lower in self.frameworks_libraries:
-                categorized["frameworks"].append(skill)
-            elif skill_lower in self.databases:
-                categorized["databases"].append(skill)
-            elif skill_lower in self.cloud_platforms:
-                categorized["cloud"].append(skill)
-            elif skill_lower in self.tools_technologies:
-                categorized["tools"].append(skill)
+            category = self._skill_to_category.get(skill.lower())
+            if category:
+                categorized[category].append(skill)
         
         return categorized
+
+# Shared instance. It only holds read-only vocabularies and a compiled pattern,
+# so one extractor can serve every request in the process.
+DEFAULT_EXTRACTOR = SkillExtractor()
+
+def extract(text: str) -> Set[str]:
+    """Extract technology keywords from text with the shared extractor."""
+    return DEFAULT_EXTRACTOR.extract_from_text(text)